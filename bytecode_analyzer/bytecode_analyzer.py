@@ -81,7 +81,7 @@ class BytecodeAnalyzer(BaseAnalyzer):
 
     def analyze(self, bytecode: str, **kwargs) -> AnalysisReport:
         start_time = time.time()
-        bytecode_hash = hashlib.sha256(bytecode.encode('utf-8')).hexdigest()
+        bytecode_hash = hashlib.sha256(bytecode.encode('utf-8'), usedforsecurity=False).hexdigest()
 
         try:
             structure = self._analyze_bytecode_structure(bytecode)
@@ -4,146 +4,75 @@ STE0104: Unlimited-Mint
 민팅 권한으로 공급을 무제한 확대하고 시장 희석
 """
 
-import re
 from typing import List, Dict, Any
 
+from contractcode_analyzer.analyzer.base import STEPatternAnalyzer
+
+
+class STE0104_Analyzer(STEPatternAnalyzer):
+    patterns = {
+        "uncapped_mint": {
+            "regex": r"function\s+(mint|_mint|issue)(?![\s\S]{0,200}?(maxSupply|MAX_SUPPLY|totalSupply\s*<=|totalSupply\s*\+.*<=))",
+            "score": 100,
+            "description": "Mint function with no maximum supply check",
+            "keywords": ("mint", "issue")
+        },
+        "owner_mint_anytime": {
+            "regex": r"function\s+mint.*onlyOwner.*\{[\s\S]{0,100}?(_mint|totalSupply\s*\+=|_balances\[.*\]\s*\+=)",
+            "score": 90,
+            "description": "Owner can mint tokens without restrictions",
+            "keywords": ("onlyowner",)
+        },
+        "hidden_mint": {
+            # The uint step is atomic (see "Atomic steps" in base.py)
+            "regex": r"function\s+(?!mint|_mint|issue)[a-zA-Z_]+\s*\((?=(.*?uint))\1.*\)[\s\S]{0,200}?totalSupply\s*\+=",
+            "score": 85,
+            "description": "Hidden function that increases supply",
+            "keywords": ("totalsupply",)
+        },
+        "mutable_max_supply": {
+            "regex": r"(maxSupply|MAX_SUPPLY|supplyCap)(?!.*constant|immutable).*=(?!.*constructor)",
+            "score": 80,
+            "description": "Maximum supply can be changed",
+            "keywords": ("maxsupply", "max_supply", "supplycap")
+        },
+        "multiple_mints": {
+            "regex": r"function\s+mint[\s\S]{0,500}?function\s+(emergencyMint|adminMint|devMint)",
+            "score": 75,
+            "description": "Multiple minting mechanisms",
+            "keywords": ("emergencymint", "adminmint", "devmint")
+        },
+        "mint_in_transfer": {
+            "regex": r"function\s+(_transfer|transfer|transferFrom)[\s\S]{0,300}?totalSupply\s*\+=",
+            "score": 70,
+            "description": "Supply increases during transfers",
+            "keywords": ("totalsupply",)
+        },
+        "rebase": {
+            "regex": r"(rebase|Rebase|_rebase).*function.*totalSupply",
+            "score": 60,
+            "description": "Rebase mechanism that changes supply",
+            "keywords": ("rebase",)
+        },
+        "no_burn": {
+            "regex": r"function\s+mint(?![\s\S]*function\s+burn)",
+            "score": 40,
+            "description": "Mint exists but no burn function",
+            "keywords": ("mint",)
+        }
+    }
+
+    scoring_logic = {
+        "method": "severity_based",
+        "multiplier_if_no_events": 1.2
+    }
 
-class STE0104_Analyzer:
     def __init__(self):
+        self.ste_id = "STE0104"
         self.name = "Unlimited-Mint"
         self.description = "민팅 권한으로 공급을 무제한 확대하고 시장 희석"
         self.weight = 1.0
 
-        self.patterns = {
-            "uncapped_mint": {
-                "regex": r"function\s+(mint|_mint|issue)(?![\s\S]{0,200}?(maxSupply|MAX_SUPPLY|totalSupply\s*<=|totalSupply\s*\+.*<=))",
-                "score": 100,
-                "description": "Mint function with no maximum supply check"
-            },
-            "owner_mint_anytime": {
-                "regex": r"function\s+mint.*onlyOwner.*\{[\s\S]{0,100}?(_mint|totalSupply\s*\+=|_balances\[.*\]\s*\+=)",
-                "score": 90,
-                "description": "Owner can mint tokens without restrictions"
-            },
-            "hidden_mint": {
-                "regex": r"function\s+(?!mint|_mint|issue)[a-zA-Z_]+\s*\(.*uint.*\)[\s\S]{0,200}?totalSupply\s*\+=",
-                "score": 85,
-                "description": "Hidden function that increases supply"
-            },
-            "mutable_max_supply": {
-                "regex": r"(maxSupply|MAX_SUPPLY|supplyCap)(?!.*constant|immutable).*=(?!.*constructor)",
-                "score": 80,
-                "description": "Maximum supply can be changed"
-            },
-            "multiple_mints": {
-                "regex": r"function\s+mint[\s\S]{0,500}?function\s+(emergencyMint|adminMint|devMint)",
-                "score": 75,
-                "description": "Multiple minting mechanisms"
-            },
-            "mint_in_transfer": {
-                "regex": r"function\s+(_transfer|transfer|transferFrom)[\s\S]{0,300}?totalSupply\s*\+=",
-                "score": 70,
-                "description": "Supply increases during transfers"
-            },
-            "rebase": {
-                "regex": r"(rebase|Rebase|_rebase).*function.*totalSupply",
-                "score": 60,
-                "description": "Rebase mechanism that changes supply"
-            },
-            "no_burn": {
-                "regex": r"function\s+mint(?![\s\S]*function\s+burn)",
-                "score": 40,
-                "description": "Mint exists but no burn function"
-            }
-        }
-
-        self.scoring_logic = {
-            "method": "severity_based",
-            "multiplier_if_no_events": 1.2
-        }
-
-    def analyze(self, contract_code: str, original_code: str = None) -> Dict[str, Any]:
-        """Analyze contract code for STE0104 patterns"""
-        matches = []
-
-        # Use original code for line number calculation if provided
-        code_for_line_numbers = original_code if original_code else contract_code
-
-        # Find all pattern matches
-        for pattern_name, pattern_config in self.patterns.items():
-            regex_pattern = pattern_config["regex"]
-            score = pattern_config["score"]
-            description = pattern_config["description"]
-
-            try:
-                # Use multiline and case-insensitive flags
-                flags = re.MULTILINE | re.DOTALL | re.IGNORECASE
-
-                for match in re.finditer(regex_pattern, contract_code, flags):
-                    # Get matched text and position in preprocessed code
-                    full_match = match.group(0)
-                    match_start = match.start()
-                    match_end = match.end()
-
-                    # Include context before and after for unique matching
-                    context_before = contract_code[max(0, match_start-30):match_start]
-                    context_after = contract_code[match_end:min(len(contract_code), match_end+30)]
-                    search_with_context = context_before + full_match[:100] + context_after
-
-                    # Find in original code with context
-                    original_match_pos = code_for_line_numbers.find(search_with_context)
-
-                    if original_match_pos != -1:
-                        # Adjust for the context_before length
-                        actual_pos = original_match_pos + len(context_before)
-                        text_before_match = code_for_line_numbers[:actual_pos]
-                        line_number = text_before_match.count('\r\n') + 1
-
-                        # Extract the full line(s) from original code for matched_text
-                        line_start = code_for_line_numbers.rfind('\r\n', 0, actual_pos)
-                        line_start = line_start + 2 if line_start != -1 else 0
-                        line_end = code_for_line_numbers.find('\r\n', actual_pos)
-                        line_end = line_end if line_end != -1 else len(code_for_line_numbers)
-                        matched_text = code_for_line_numbers[line_start:line_end][:200]
-                    else:
-                        # Fallback: try without context
-                        original_match_pos = code_for_line_numbers.find(full_match[:100])
-                        if original_match_pos != -1:
-                            text_before_match = code_for_line_numbers[:original_match_pos]
-                            line_number = text_before_match.count('\r\n') + 1
-
-                            # Extract the full line(s) from original code
-                            line_start = code_for_line_numbers.rfind('\r\n', 0, original_match_pos)
-                            line_start = line_start + 2 if line_start != -1 else 0
-                            line_end = code_for_line_numbers.find('\r\n', original_match_pos)
-                            line_end = line_end if line_end != -1 else len(code_for_line_numbers)
-                            matched_text = code_for_line_numbers[line_start:line_end][:200]
-                        else:
-                            line_number = -1
-                            matched_text = full_match[:200]
-
-                    matches.append({
-                        "pattern_name": pattern_name,
-                        "score": score,
-                        "description": description,
-                        "matched_text": matched_text,
-                        "line_number": line_number
-                    })
-
-            except re.error as e:
-                print(f"Regex error in pattern {pattern_name}: {e}")
-
-        # Calculate final score using scoring logic
-        final_score = self._calculate_score(matches)
-
-        return {
-            "ste_id": "STE0104",
-            "name": self.name,
-            "description": self.description,
-            "score": final_score,
-            "matches": matches
-        }
-
     def _calculate_score(self, matches: List[Dict[str, Any]]) -> float:
         """Calculate score based on matches and scoring logic"""
         if not matches:
@@ -164,4 +93,4 @@ class STE0104_Analyzer:
             return min(100, score)
 
         # Default: take maximum
-        return max(match["score"] for match in matches)
\ No newline at end of file
+        return max(match["score"] for match in matches)
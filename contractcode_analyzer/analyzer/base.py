@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Base class for regex-table STE analyzers
+패턴 테이블 기반 STE 분석기의 공통 스캔 로직
+"""
+
+import re
+import bisect
+import string
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional
+
+# Patterns run against lowercased source, so they are compiled lowercase
+# without re.IGNORECASE and the regex VM compares characters exactly;
+# ASCII-only \w and \s are all Solidity source needs
+PATTERN_FLAGS = re.MULTILINE | re.DOTALL | re.ASCII
+
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Atomic steps: re before Python 3.11 has no atomic groups, so the STE patterns
+# spell one as a lookahead plus backreference. (?=(.*?X))\N matches up to the
+# first X, and since a lookahead is never re-entered once it has matched,
+# backtracking cannot retry any later X. Patterns use this only where the
+# greedy step that follows sees the same candidates from the first X as from
+# any later one, so matches are unchanged; failing candidates just stop
+# retrying every combination of positions.
+
+
+def compile_pattern(regex: str) -> re.Pattern:
+    """Compile an STE regex for matching against lowercased source"""
+    # Lowercase literals but never the letter after a backslash (\S, \W, ...)
+    lowered = []
+    i = 0
+    while i < len(regex):
+        if regex[i] == '\\':
+            lowered.append(regex[i:i+2])
+            i += 2
+        else:
+            lowered.append(regex[i].lower())
+            i += 1
+    return re.compile(''.join(lowered), PATTERN_FLAGS)
+
+
+def lowercase_code(code: str) -> str:
+    """Lowercase ASCII letters only, so offsets stay aligned"""
+    if code.isascii():
+        return code.lower()
+    # str.lower() would also fold non-ASCII letters, some into several
+    # characters or into ASCII ones (the Kelvin sign becomes 'k')
+    return code.translate(_ASCII_LOWER)
+
+
+def index_line_starts(code: str) -> List[int]:
+    """Offsets at which each line of code starts, so line numbers are a bisect away"""
+    line_starts = [0]
+    # Split on '\n' so LF and CRLF sources are both indexed
+    line_starts.extend(m.end() for m in re.finditer('\n', code))
+    return line_starts
+
+
+class OffsetMap:
+    """
+    Map from positions in preprocessed code to positions in the original source
+
+    Preprocessing only removes segments, so preprocessed code is a series of
+    runs copied unchanged from the original. Only where each run starts and
+    how far it has shifted are stored, so the map grows with the number of
+    removed segments rather than with the length of the code.
+    """
+
+    def __init__(self):
+        self.run_starts: List[int] = []  # Index in preprocessed code where each run starts
+        self.run_shifts: List[int] = []  # Original index minus preprocessed index within each run
+
+    def add_run(self, start: int, original_start: int) -> None:
+        """Record a run starting at start that came from original_start"""
+        self.run_starts.append(start)
+        self.run_shifts.append(original_start - start)
+
+    def __getitem__(self, pos: int) -> int:
+        """Index in the original source of preprocessed position pos"""
+        # Later runs win on equal starts: a run emptied by adjacent removals
+        # holds no characters
+        run = bisect.bisect_right(self.run_starts, pos) - 1
+        return pos + self.run_shifts[run]
+
+
+@dataclass
+class AnalysisContext:
+    """
+    Per-contract state shared by every STE analyzer
+
+    Built once per contract so the analyzers do not each lowercase the
+    source or index its lines again.
+    """
+    code: str                            # Preprocessed (comment-stripped) source
+    original_code: str                   # Source that line numbers refer to
+    line_starts: List[int]               # Offsets at which each line of original_code starts
+    offsets: Optional[OffsetMap] = None  # offsets[i] is the index in original_code of code[i]
+    code_lower: str = field(init=False)  # code with ASCII letters lowercased
+
+    def __post_init__(self):
+        self.code_lower = lowercase_code(self.code)
+
+
+class STEPatternAnalyzer(ABC):
+    """
+    Base class for STE analyzers driven by a table of regex patterns
+
+    Subclasses set ste_id, name and description per instance, and patterns
+    and scoring_logic as class attributes shared by every instance. Each
+    pattern entry holds "regex", "score" and "description", plus an
+    optional "keywords" tuple used as a prefilter; "compiled" is added when
+    the subclass is defined. Subclasses implement _calculate_score.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Compile every pattern once, for the class that declares the table
+        for pattern_config in cls.__dict__.get("patterns", {}).values():
+            pattern_config["compiled"] = compile_pattern(pattern_config["regex"])
+
+    def analyze(self, contract_code: str, original_code: str = None,
+                line_starts: List[int] = None, offsets: OffsetMap = None) -> Dict[str, Any]:
+        """
+        Analyze contract code for this analyzer's STE patterns
+
+        Args:
+            contract_code: Preprocessed (comment-stripped) source code
+            original_code: Source code that line numbers refer to
+            line_starts: Offsets at which each line of original_code starts
+            offsets: offsets[i] is the index in original_code of contract_code[i]
+        """
+        # Use original code for line number calculation if provided
+        if not original_code:
+            original_code = contract_code
+        if line_starts is None:
+            line_starts = index_line_starts(original_code)
+
+        return self.analyze_context(
+            AnalysisContext(contract_code, original_code, line_starts, offsets)
+        )
+
+    def analyze_context(self, context: AnalysisContext) -> Dict[str, Any]:
+        """Analyze a contract whose shared per-contract state is already built"""
+        matches = []
+
+        contract_code = context.code
+        code_for_line_numbers = context.original_code
+        code_lower = context.code_lower
+        line_starts = context.line_starts
+        offsets = context.offsets
+
+        # Find all pattern matches
+        for pattern_name, pattern_config in self.patterns.items():
+            # A pattern cannot match unless one of its keywords is present
+            keywords = pattern_config.get("keywords")
+            if keywords and not any(keyword in code_lower for keyword in keywords):
+                continue
+
+            compiled = pattern_config["compiled"]
+            score = pattern_config["score"]
+            description = pattern_config["description"]
+
+            for match in compiled.finditer(code_lower):
+                # Position in preprocessed code; matched text is sliced (in its
+                # original case) only where needed, never in full
+                match_start = match.start()
+                match_end = match.end()
+
+                if offsets is not None:
+                    original_match_pos = offsets[match_start]
+                elif code_for_line_numbers is contract_code:
+                    original_match_pos = match_start
+                else:
+                    original_match_pos = self._find_in_original(
+                        contract_code, code_for_line_numbers, match_start, match_end
+                    )
+
+                if original_match_pos != -1:
+                    line_number = bisect.bisect_right(line_starts, original_match_pos)
+
+                    # Extract the full line(s) from original code for matched_text;
+                    # the next line starts just past this line's '\n' (and a CRLF
+                    # line keeps a trailing '\r', stripped here)
+                    line_start = line_starts[line_number - 1]
+                    line_end = (line_starts[line_number] - 1 if line_number < len(line_starts)
+                                else len(code_for_line_numbers))
+                    matched_text = code_for_line_numbers[line_start:min(line_end, line_start + 200)].rstrip('\r')
+                else:
+                    line_number = -1
+                    matched_text = contract_code[match_start:min(match_end, match_start + 200)]
+
+                matches.append({
+                    "pattern_name": pattern_name,
+                    "score": score,
+                    "description": description,
+                    "matched_text": matched_text,
+                    "line_number": line_number
+                })
+
+        # Calculate final score using scoring logic
+        final_score = self._calculate_score(matches)
+
+        return {
+            "ste_id": self.ste_id,
+            "name": self.name,
+            "description": self.description,
+            "score": final_score,
+            "matches": matches
+        }
+
+    def _find_in_original(self, contract_code: str, original_code: str,
+                          match_start: int, match_end: int) -> int:
+        """Locate a match in original code when no offset map is available"""
+        match_head = contract_code[match_start:min(match_end, match_start + 100)]
+
+        # Include context before and after for unique matching
+        context_before = contract_code[max(0, match_start-30):match_start]
+        context_after = contract_code[match_end:min(len(contract_code), match_end+30)]
+        search_with_context = context_before + match_head + context_after
+
+        # Preprocessing only removes text, so the match cannot sit before the
+        # same offset in the original code; searching from there skips any
+        # earlier lookalikes
+        search_start = match_start - len(context_before)
+
+        # Find in original code with context
+        original_match_pos = original_code.find(search_with_context, search_start)
+        if original_match_pos != -1:
+            # Adjust for the context_before length
+            return original_match_pos + len(context_before)
+
+        # Fallback: try without context
+        return original_code.find(match_head, match_start)
+
+    @abstractmethod
+    def _calculate_score(self, matches: List[Dict[str, Any]]) -> float:
+        """Calculate score based on matches and scoring logic"""
+        pass
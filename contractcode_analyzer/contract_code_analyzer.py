@@ -6,15 +6,21 @@ Contract Code Analyzer
 소스코드를 분석하여 scam 패턴과 보안 취약점을 탐지합니다.
 """
 
+import re
 import time
+import bisect
+import pickle
 import hashlib
-from typing import List, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import sys
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
+from contractcode_analyzer.analyzer.base import AnalysisContext, OffsetMap, index_line_starts
 from contractcode_analyzer.analyzer.STE0101_1 import STE0101_1_Analyzer
 from contractcode_analyzer.analyzer.STE0101_2 import STE0101_2_Analyzer
 from contractcode_analyzer.analyzer.STE0101_3 import STE0101_3_Analyzer
@@ -22,6 +28,69 @@ from contractcode_analyzer.analyzer.STE0103 import STE0103_Analyzer
 from contractcode_analyzer.analyzer.STE0104 import STE0104_Analyzer
 from contractcode_analyzer.analyzer.STE0105 import STE0105_Analyzer
 
+# Comments stripped before analysis, both kinds in one left-to-right pass so
+# whichever comment opens first wins (as in the Solidity lexer)
+_COMMENT_RE = re.compile(r'//[^\n]*|/\*[\s\S]*?\*/')
+
+# Tokens at least one of which every STE pattern needs in order to match
+# (all patterns are matched against lowercased code, so these are lowercase too).
+# Source without any of them - empty, whitespace/comment-only or non-Solidity
+# input - skips the regex scans entirely.
+_SOLIDITY_TOKENS = (
+    "function", "require", "revert", "return", "assert", "else",
+    "fee", "tax", "commission", "uint", "mapping", "timestamp",
+    "_implementation", "selfdestruct", "delegatecall", "assembly", "beacon",
+    "maxsupply", "max_supply", "supplycap", "payable", "balance"
+)
+
+# Inclusive score range of each risk level, in ascending order; scores that
+# fall between two ranges (e.g. 20.5) or outside all of them are "UNKNOWN"
+_RISK_LEVELS = (
+    (0, 20, "LOW_RISK"),
+    (21, 40, "MEDIUM_RISK"),
+    (41, 60, "HIGH_RISK"),
+    (61, 80, "VERY_HIGH_RISK"),
+    (81, 100, "CRITICAL_RISK")
+)
+_RISK_UPPER_BOUNDS = [max_score for _, max_score, _ in _RISK_LEVELS]
+
+
+def _strip_matches(pattern: re.Pattern, code: str) -> Tuple[str, OffsetMap]:
+    """Remove every match of pattern from code, mapping the result back onto code"""
+    pieces = []
+    offsets = OffsetMap()
+    stripped_length = 0
+    pos = 0
+    for match in pattern.finditer(code):
+        offsets.add_run(stripped_length, pos)
+        pieces.append(code[pos:match.start()])
+        stripped_length += match.start() - pos
+        pos = match.end()
+    # The last run also maps the end of the stripped code to the end of code
+    offsets.add_run(stripped_length, pos)
+    pieces.append(code[pos:])
+    return ''.join(pieces), offsets
+
+
+# Number of distinct contracts whose STE results ContractCodeAnalyzer keeps
+_RESULT_CACHE_SIZE = 1024
+
+
+# Analyzer owned by a worker process of ContractCodeAnalyzer.analyze_many
+_worker_analyzer = None
+
+
+def _init_worker() -> None:
+    """Create the per-process analyzer once when a worker starts"""
+    global _worker_analyzer
+    _worker_analyzer = ContractCodeAnalyzer()
+
+
+def _analyze_in_worker(contract: Tuple[str, str]) -> Dict[str, Any]:
+    """Analyze one (contract_code, contract_name) pair inside a worker process"""
+    contract_code, contract_name = contract
+    return _worker_analyzer.analyze(contract_code, contract_name)
+
 
 class ContractCodeAnalyzer:
     """Main contract code analyzer that coordinates all STE analyzers"""
@@ -37,44 +106,40 @@ class ContractCodeAnalyzer:
             STE0105_Analyzer()
         ]
 
-        self.risk_levels = {
-            (0, 20): "LOW_RISK",
-            (21, 40): "MEDIUM_RISK",
-            (41, 60): "HIGH_RISK",
-            (61, 80): "VERY_HIGH_RISK",
-            (81, 100): "CRITICAL_RISK"
-        }
+        # STE results of recently analyzed sources, keyed by code hash (LRU)
+        self._result_cache = OrderedDict()
 
     def _preprocess_code(self, contract_code: str) -> tuple:
-        """Preprocess contract code for analysis and create position mapping"""
-        import re
-
-        # Create position mapping from preprocessed to original
-        position_map = []  # List of (preprocessed_pos, original_pos) tuples
-
-        # Remove single line comments
-        code = contract_code
-        for match in re.finditer(r'//.*?$', code, flags=re.MULTILINE):
-            position_map.append((match.start(), match.start(), match.end()))
-        code = re.sub(r'//.*?$', '', code, flags=re.MULTILINE)
-
-        # Remove multi-line comments
-        comment_removals = []
-        for match in re.finditer(r'/\*.*?\*/', contract_code, flags=re.DOTALL):
-            comment_removals.append((match.start(), match.end()))
-
-        # Build mapping: for each position in preprocessed code, what's the position in original?
-        # Simple approach: just return both codes and calculate line numbers directly from original
-        code = re.sub(r'/\*.*?\*/', '', contract_code, flags=re.DOTALL)
-        code = re.sub(r'//.*?$', '', code, flags=re.MULTILINE)
+        """
+        Preprocess contract code for analysis by stripping comments
 
-        return code, contract_code  # Return preprocessed and original
+        Returns the preprocessed code, the original code and an OffsetMap
+        whose entry i is the original index of preprocessed character i.
+        """
+        code, offsets = _strip_matches(_COMMENT_RE, contract_code)
+
+        return code, contract_code, offsets
+
+    def _has_solidity_tokens(self, code_lower: str) -> bool:
+        """Check whether lowercased code contains anything the STE patterns could match"""
+        return any(token in code_lower for token in _SOLIDITY_TOKENS)
+
+    def _empty_result(self, analyzer) -> Dict[str, Any]:
+        """Build the result an analyzer returns when nothing matches"""
+        return {
+            "ste_id": analyzer.ste_id,
+            "name": analyzer.name,
+            "description": analyzer.description,
+            "score": 0.0,
+            "matches": []
+        }
 
     def _get_risk_level(self, score: float) -> str:
         """Get risk level based on score"""
-        for (min_score, max_score), risk_level in self.risk_levels.items():
-            if min_score <= score <= max_score:
-                return risk_level
+        # The only range that can hold score is the first one ending at or above it
+        index = bisect.bisect_left(_RISK_UPPER_BOUNDS, score)
+        if index < len(_RISK_LEVELS) and _RISK_LEVELS[index][0] <= score:
+            return _RISK_LEVELS[index][2]
         return "UNKNOWN"
 
     def analyze(self, contract_code: str, contract_name: str = "Unknown") -> Dict[str, Any]:
@@ -88,38 +153,44 @@ class ContractCodeAnalyzer:
         Returns:
             Analysis report with all STE results
         """
-        start_time = time.time()
-
-        # Calculate code hash for identification
-        code_hash = hashlib.sha256(contract_code.encode('utf-8')).hexdigest()
-
-        # Preprocess code
-        preprocessed_code, original_code = self._preprocess_code(contract_code)
-
-        # Run all analyzers
-        results = []
+        start_time = time.perf_counter()
+
+        # Calculate code hash for identification (not a security use)
+        code_hash = hashlib.sha256(contract_code.encode('utf-8'), usedforsecurity=False).hexdigest()
+
+        # Identical sources (forks, template tokens) reuse earlier STE results.
+        # The cache keeps a pickled copy, so a fresh analysis is returned as is
+        # and each hit unpickles its own results that callers may edit freely
+        frozen_results = self._result_cache.get(code_hash)
+        if frozen_results is not None:
+            self._result_cache.move_to_end(code_hash)
+            results = pickle.loads(frozen_results)
+        else:
+            results = self._run_analyzers(contract_code)
+            self._result_cache[code_hash] = pickle.dumps(results, pickle.HIGHEST_PROTOCOL)
+            if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+        # Track scores and bucket findings by severity in a single pass
         total_risk_score = 0
         max_individual_score = 0
-
-        for analyzer in self.analyzers:
-            try:
-                # Pass both preprocessed code and original code for line number calculation
-                result = analyzer.analyze(preprocessed_code, original_code=original_code)
-                results.append(result)
-
-                # Track scores
-                score = result.get("score", 0)
-                total_risk_score += score
-                max_individual_score = max(max_individual_score, score)
-
-            except Exception as e:
-                results.append({
-                    "ste_id": getattr(analyzer, 'ste_id', 'UNKNOWN'),
-                    "name": getattr(analyzer, 'name', 'Unknown'),
-                    "error": str(e),
-                    "score": 0,
-                    "matches": []
-                })
+        total_patterns_detected = 0
+        critical_findings = []
+        high_risk_findings = []
+        medium_risk_findings = []
+
+        for result in results:
+            score = result.get("score", 0)
+            total_risk_score += score
+            max_individual_score = max(max_individual_score, score)
+            total_patterns_detected += len(result.get("matches", []))
+
+            if score >= 80:
+                critical_findings.append(result)
+            elif score >= 60:
+                high_risk_findings.append(result)
+            elif score >= 40:
+                medium_risk_findings.append(result)
 
         # Calculate overall risk score (average of all STE scores)
         avg_score = total_risk_score / len(self.analyzers) if self.analyzers else 0
@@ -130,8 +201,8 @@ class ContractCodeAnalyzer:
         # Determine overall risk level
         overall_risk = self._get_risk_level(overall_score)
 
-        # Calculate execution time
-        execution_time = time.time() - start_time
+        # Calculate execution time (monotonic clock; the timestamp below is wall clock)
+        execution_time = time.perf_counter() - start_time
 
         # Build report
         report = {
@@ -145,15 +216,71 @@ class ContractCodeAnalyzer:
             "average_score": round(avg_score, 2),
             "ste_results": results,
             "summary": {
-                "total_patterns_detected": sum(len(r.get("matches", [])) for r in results),
-                "critical_findings": [r for r in results if r.get("score", 0) >= 80],
-                "high_risk_findings": [r for r in results if 60 <= r.get("score", 0) < 80],
-                "medium_risk_findings": [r for r in results if 40 <= r.get("score", 0) < 60]
+                "total_patterns_detected": total_patterns_detected,
+                "critical_findings": critical_findings,
+                "high_risk_findings": high_risk_findings,
+                "medium_risk_findings": medium_risk_findings
             }
         }
 
         return report
 
+    def _run_analyzers(self, contract_code: str) -> List[Dict[str, Any]]:
+        """Run every STE analyzer over contract code and collect their results"""
+        # Preprocess code
+        preprocessed_code, original_code, offsets = self._preprocess_code(contract_code)
+
+        # Lowercased code and line-start offsets, shared by all analyzers
+        context = AnalysisContext(
+            preprocessed_code, original_code, index_line_starts(original_code), offsets
+        )
+
+        # Skip the regex scans when no pattern could possibly match
+        if not self._has_solidity_tokens(context.code_lower):
+            return [self._empty_result(analyzer) for analyzer in self.analyzers]
+
+        results = []
+        for analyzer in self.analyzers:
+            try:
+                result = analyzer.analyze_context(context)
+                results.append(result)
+
+            except Exception as e:
+                results.append({
+                    "ste_id": getattr(analyzer, 'ste_id', 'UNKNOWN'),
+                    "name": getattr(analyzer, 'name', 'Unknown'),
+                    "error": str(e),
+                    "score": 0,
+                    "matches": []
+                })
+
+        return results
+
+    def analyze_many(
+        self,
+        contracts: List[Tuple[str, str]],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze many contracts in parallel across worker processes
+
+        Each worker keeps one ContractCodeAnalyzer and runs the STE analyzers
+        sequentially for the contracts it is handed.
+
+        Args:
+            contracts: List of (contract_code, contract_name) tuples
+            max_workers: Number of worker processes (defaults to CPU count)
+
+        Returns:
+            Analysis reports in the same order as contracts
+        """
+        if len(contracts) < 2 or max_workers == 1:
+            return [self.analyze(contract_code, contract_name)
+                    for contract_code, contract_name in contracts]
+
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+            return list(executor.map(_analyze_in_worker, contracts))
+
     def analyze_file(self, file_path: str) -> Dict[str, Any]:
         """
         Analyze contract from file
@@ -227,9 +354,18 @@ if __name__ == "__main__":
     # Example usage
     analyzer = ContractCodeAnalyzer()
 
-    if len(sys.argv) > 1:
+    if len(sys.argv) > 2:
+        # Several files: analyze them in parallel
+        contracts = []
+        for file_path in sys.argv[1:]:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                contracts.append((f.read(), Path(file_path).stem))
+
+        for report in analyzer.analyze_many(contracts):
+            analyzer.print_report(report)
+    elif len(sys.argv) > 1:
         file_path = sys.argv[1]
         report = analyzer.analyze_file(file_path)
         analyzer.print_report(report)
     else:
-        print("Usage: python contract_code_analyzer.py <contract_file.sol>")
+        print("Usage: python contract_code_analyzer.py <contract_file.sol> [<contract_file.sol> ...]")
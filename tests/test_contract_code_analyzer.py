@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Regression tests for ContractCodeAnalyzer line attribution and preprocessing
+"""
+
+import unittest
+from unittest import mock
+
+from contractcode_analyzer import contract_code_analyzer
+from contractcode_analyzer.contract_code_analyzer import ContractCodeAnalyzer
+
+
+def _matches(report, ste_id, pattern_name):
+    """Matches of one pattern in one STE result of a report"""
+    for result in report["ste_results"]:
+        if result["ste_id"] == ste_id:
+            return [match for match in result["matches"] if match["pattern_name"] == pattern_name]
+    return []
+
+
+class ContractCodeAnalyzerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.analyzer = ContractCodeAnalyzer()
+
+    def test_lf_source_reports_real_line_numbers(self):
+        source = (
+            "pragma solidity ^0.8.0;\n"
+            "contract Vault {\n"
+            "    function withdraw() external onlyOwner {\n"
+            "        payable(msg.sender).transfer(address(this).balance);\n"
+            "    }\n"
+            "}\n"
+        )
+        matches = _matches(self.analyzer.analyze(source), "STE0105", "owner_only_withdraw")
+
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0]["line_number"], 3)
+        self.assertEqual(matches[0]["matched_text"], "    function withdraw() external onlyOwner {")
+
+    def test_block_opener_inside_line_comment_does_not_hide_code(self):
+        source = (
+            "contract Vault {\n"
+            "    // withdrawals: see /* below\n"
+            "    function withdraw() external onlyOwner {\n"
+            "        payable(msg.sender).transfer(address(this).balance);\n"
+            "    }\n"
+            "    /* end */\n"
+            "}\n"
+        )
+        matches = _matches(self.analyzer.analyze(source), "STE0105", "owner_only_withdraw")
+
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0]["line_number"], 3)
+
+
+class CommentOffsetTest(unittest.TestCase):
+    """Matches after stripped comments map back to the right original line"""
+
+    WITHDRAW_LINE = "    function withdraw() external onlyOwner {"
+    WITHDRAW_BODY = (
+        "        payable(msg.sender).transfer(address(this).balance);\n"
+        "    }\n"
+    )
+
+    def setUp(self):
+        self.analyzer = ContractCodeAnalyzer()
+
+    def _withdraw_match(self, source):
+        matches = _matches(self.analyzer.analyze(source), "STE0105", "owner_only_withdraw")
+        self.assertEqual(len(matches), 1)
+        return matches[0]
+
+    def test_block_comment_at_start_of_file(self):
+        source = "/* header */contract Vault {\n" + self.WITHDRAW_LINE + "\n" + self.WITHDRAW_BODY + "}\n"
+        match = self._withdraw_match(source)
+
+        self.assertEqual(match["line_number"], 2)
+        self.assertEqual(match["matched_text"], self.WITHDRAW_LINE)
+
+    def test_line_comment_at_start_of_file(self):
+        source = "// header\ncontract Vault {\n" + self.WITHDRAW_LINE + "\n" + self.WITHDRAW_BODY + "}\n"
+        match = self._withdraw_match(source)
+
+        self.assertEqual(match["line_number"], 3)
+        self.assertEqual(match["matched_text"], self.WITHDRAW_LINE)
+
+    def test_back_to_back_comments(self):
+        line = "    /* a *//* b */function withdraw() external onlyOwner {"
+        source = "contract Vault {\n/* c *//* d */// e\n" + line + "\n" + self.WITHDRAW_BODY + "}\n"
+        match = self._withdraw_match(source)
+
+        self.assertEqual(match["line_number"], 3)
+        self.assertEqual(match["matched_text"], line)
+
+    def test_comment_at_end_of_file(self):
+        for trailer in ("/* end */", "// end", "// end\n"):
+            with self.subTest(trailer=trailer):
+                source = "contract Vault {\n" + self.WITHDRAW_LINE + "\n" + self.WITHDRAW_BODY + "}\n" + trailer
+                match = self._withdraw_match(source)
+
+                self.assertEqual(match["line_number"], 2)
+                self.assertEqual(match["matched_text"], self.WITHDRAW_LINE)
+
+    def test_crlf_inside_block_comment(self):
+        source = (
+            "contract Vault {\r\n"
+            "    /* first\r\n"
+            "       second\r\n"
+            "    */\r\n"
+            + self.WITHDRAW_LINE + "\r\n"
+            + self.WITHDRAW_BODY.replace("\n", "\r\n")
+            + "}\r\n"
+        )
+        match = self._withdraw_match(source)
+
+        self.assertEqual(match["line_number"], 5)
+        self.assertEqual(match["matched_text"], self.WITHDRAW_LINE)
+
+
+class ResultCacheTest(unittest.TestCase):
+
+    SOURCE = (
+        "contract Vault {\n"
+        "    function withdraw() external onlyOwner {\n"
+        "        payable(msg.sender).transfer(address(this).balance);\n"
+        "    }\n"
+        "}\n"
+    )
+
+    def setUp(self):
+        self.analyzer = ContractCodeAnalyzer()
+
+    def test_cache_hit_reuses_results(self):
+        first = self.analyzer.analyze(self.SOURCE)
+        with mock.patch.object(self.analyzer, "_run_analyzers") as run_analyzers:
+            second = self.analyzer.analyze(self.SOURCE)
+
+        run_analyzers.assert_not_called()
+        self.assertEqual(second["ste_results"], first["ste_results"])
+        self.assertIsNot(second["ste_results"], first["ste_results"])
+
+    def test_least_recently_used_entry_is_evicted(self):
+        sources = ["contract C%d {}\n" % i for i in range(3)]
+        with mock.patch.object(contract_code_analyzer, "_RESULT_CACHE_SIZE", 2):
+            reports = [self.analyzer.analyze(source) for source in sources[:2]]
+            # Touch the first source so the second becomes the oldest entry
+            self.analyzer.analyze(sources[0])
+            self.analyzer.analyze(sources[2])
+
+        cached_hashes = list(self.analyzer._result_cache)
+        self.assertEqual(len(cached_hashes), 2)
+        self.assertIn(reports[0]["code_hash"], cached_hashes)
+        self.assertNotIn(reports[1]["code_hash"], cached_hashes)
+
+    def test_editing_a_report_does_not_change_the_cache(self):
+        first = self.analyzer.analyze(self.SOURCE)
+        expected = [dict(result, matches=list(result["matches"])) for result in first["ste_results"]]
+        for result in first["ste_results"]:
+            result["score"] = -1
+            result["matches"].clear()
+        first["ste_results"].clear()
+
+        second = self.analyzer.analyze(self.SOURCE)
+        self.assertEqual(second["ste_results"], expected)
+
+        # Hits are independent of each other too
+        second["ste_results"][0]["matches"].append({})
+        self.assertEqual(self.analyzer.analyze(self.SOURCE)["ste_results"], expected)
+
+
+class AnalyzeManyTest(unittest.TestCase):
+
+    CONTRACTS = [
+        (ResultCacheTest.SOURCE, "Vault"),
+        ("contract Empty {}\n", "Empty"),
+        ("contract Minter {\n"
+         "    function reward(address to, uint256 amount) internal {\n"
+         "        totalSupply += amount;\n"
+         "    }\n"
+         "}\n", "Minter"),
+    ]
+
+    @staticmethod
+    def _comparable(report):
+        """Report fields that do not depend on timing"""
+        return {key: report[key] for key in
+                ("contract_name", "code_hash", "overall_score", "overall_risk", "ste_results")}
+
+    def test_process_pool_matches_serial_analysis_in_order(self):
+        analyzer = ContractCodeAnalyzer()
+        reports = analyzer.analyze_many(self.CONTRACTS, max_workers=2)
+        expected = [analyzer.analyze(code, name) for code, name in self.CONTRACTS]
+
+        self.assertEqual([self._comparable(report) for report in reports],
+                         [self._comparable(report) for report in expected])
+
+
+if __name__ == "__main__":
+    unittest.main()
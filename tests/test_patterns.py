@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for STE patterns rewritten with atomic steps (see base.py)
+
+Each rewritten pattern must still match a positive sample, still reject a
+negative one, and report the same spans as the plain pattern it replaced.
+"""
+
+import re
+import unittest
+
+from contractcode_analyzer.analyzer.base import lowercase_code
+from contractcode_analyzer.analyzer.STE0101_1 import STE0101_1_Analyzer
+from contractcode_analyzer.analyzer.STE0101_2 import STE0101_2_Analyzer
+from contractcode_analyzer.analyzer.STE0101_3 import STE0101_3_Analyzer
+from contractcode_analyzer.analyzer.STE0104 import STE0104_Analyzer
+from contractcode_analyzer.analyzer.STE0105 import STE0105_Analyzer
+
+# Flags the patterns were matched with before the rewrites
+ORIGINAL_FLAGS = re.MULTILINE | re.DOTALL | re.IGNORECASE
+
+# (analyzer class, pattern name, original regex, positive sample, negative sample)
+CASES = [
+    (
+        STE0101_1_Analyzer, "dex_revert",
+        r"(to|recipient|_to)\s*==\s*.*(pair|router|pool|dex|swap|pancake|uniswap|sushi).*\).*\{[\s\S]{0,100}?(revert|require\s*\(\s*false|return\s+false)",
+        "if (to == uniswapPair) {\n    revert(\"no sells\");\n}\n",
+        "if (to == uniswapPair) {\n    _balances[to] += amount;\n}\n",
+    ),
+    (
+        STE0101_1_Analyzer, "dex_conditional",
+        r"if\s*\(\s*(to|recipient|_to)\s*==\s*.*(pair|router|pool|dex).*\).*\{[\s\S]{0,200}?(require|revert|assert)",
+        "if (recipient == pancakeRouter) {\n    require(tradingOpen);\n}\n",
+        "if (recipient == pancakeRouter) {\n    emit Sell(amount);\n}\n",
+    ),
+    (
+        STE0101_1_Analyzer, "asymmetric_transfer",
+        r"if\s*\(\s*(from|msg\.sender|_from)\s*==\s*.*(pair|router).*\)[\s\S]{0,50}?else\s+if\s*\(\s*(to|recipient|_to)\s*==\s*.*(pair|router)",
+        "if (from == uniswapPair) {\n    buy();\n} else if (to == uniswapPair) {\n    sell();\n}\n",
+        "if (from == uniswapPair) {\n    buy();\n} else {\n    move();\n}\n",
+    ),
+    (
+        STE0101_1_Analyzer, "sell_limit",
+        r"if\s*\(\s*(to|recipient)\s*==.*pair.*\)[\s\S]{0,100}?require\(.*amount\s*<=\s*maxSell",
+        "if (to == uniswapPair) {\n    require(amount <= maxSellAmount);\n}\n",
+        "if (to == uniswapPair) {\n    require(amount <= maxBuyAmount);\n}\n",
+    ),
+    (
+        STE0101_2_Analyzer, "owner_fee_control",
+        r"function\s+set.*(Fee|Tax).*\(.*uint.*\).*(?:public|external).*(?:onlyOwner|admin|governance)",
+        "function setSellFee(uint256 fee) external onlyOwner {\n    sellFee = fee;\n}\n",
+        "function setSellFee(uint256 fee) external {\n    sellFee = fee;\n}\n",
+    ),
+    (
+        STE0101_3_Analyzer, "permanent_blacklist",
+        r"mapping.*address.*bool.*blacklist(?![\s\S]*removeFromBlacklist)",
+        "mapping(address => bool) private _blacklist;\n"
+        "function addToBlacklist(address a) external onlyOwner { _blacklist[a] = true; }\n",
+        "mapping(address => uint256) private _blacklistedAt;\n"
+        "function addToBlacklist(address a) external onlyOwner { _blacklistedAt[a] = block.number; }\n",
+    ),
+    (
+        STE0104_Analyzer, "hidden_mint",
+        r"function\s+(?!mint|_mint|issue)[a-zA-Z_]+\s*\(.*uint.*\)[\s\S]{0,200}?totalSupply\s*\+=",
+        "function reward(address to, uint256 amount) internal {\n    totalSupply += amount;\n}\n",
+        "function reward(address to, uint256 amount) internal {\n    totalSupply -= amount;\n}\n",
+    ),
+    (
+        STE0105_Analyzer, "no_refund",
+        r"payable(?![\s\S]*(refund|Refund|return.*value|msg\.sender\.transfer))",
+        "function buy() external payable {\n    sold += msg.value;\n}\n",
+        "function buy() external payable returns (uint256) {\n    return msg.value;\n}\n",
+    ),
+]
+
+
+def _spans(pattern, code):
+    return [match.span() for match in pattern.finditer(code)]
+
+
+class AtomicStepPatternTest(unittest.TestCase):
+
+    def test_positive_samples_match(self):
+        for analyzer_class, name, _, positive, _ in CASES:
+            with self.subTest(pattern=name):
+                compiled = analyzer_class.patterns[name]["compiled"]
+                self.assertIsNotNone(compiled.search(lowercase_code(positive)))
+
+    def test_negative_samples_do_not_match(self):
+        for analyzer_class, name, _, _, negative in CASES:
+            with self.subTest(pattern=name):
+                compiled = analyzer_class.patterns[name]["compiled"]
+                self.assertIsNone(compiled.search(lowercase_code(negative)))
+
+    def test_spans_match_original_patterns(self):
+        for analyzer_class, name, original_regex, positive, negative in CASES:
+            compiled = analyzer_class.patterns[name]["compiled"]
+            original = re.compile(original_regex, ORIGINAL_FLAGS)
+            # The samples on their own and run together, so later samples
+            # give the steps further candidates to backtrack into
+            for code in (positive, negative, positive + negative, negative + positive):
+                with self.subTest(pattern=name, code=code):
+                    self.assertEqual(_spans(compiled, lowercase_code(code)), _spans(original, code))
+
+
+if __name__ == "__main__":
+    unittest.main()
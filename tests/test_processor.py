@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for TokenAnalysisProcessor input loading and report output
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import processor
+
+
+DOCUMENT = {
+    "contractName": "Vault",
+    "contractAddress": "0x0000000000000000000000000000000000000001",
+    "sourceCode": "contract Vault { // 금고\n    function withdraw() external onlyOwner {} }\n",
+    "bytecode": "0x6080604052"
+}
+
+
+class LoadJsonTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def _load_through_fifo(self):
+        """Write DOCUMENT into a FIFO from another thread and load it back"""
+        fifo_path = os.path.join(self.tmp_dir.name, "input.fifo")
+        os.mkfifo(fifo_path)
+
+        def write():
+            with open(fifo_path, 'w', encoding='utf-8') as f:
+                json.dump(DOCUMENT, f, ensure_ascii=False)
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            return processor._load_json(fifo_path)
+        finally:
+            writer.join()
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "needs FIFOs")
+    def test_fifo_input(self):
+        self.assertEqual(self._load_through_fifo(), DOCUMENT)
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "needs FIFOs")
+    def test_fifo_input_without_orjson(self):
+        with mock.patch.object(processor, "orjson", None):
+            self.assertEqual(self._load_through_fifo(), DOCUMENT)
+
+    def test_regular_file_input(self):
+        path = os.path.join(self.tmp_dir.name, "input.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(DOCUMENT, f, ensure_ascii=False)
+
+        self.assertEqual(processor._load_json(path), DOCUMENT)
+
+    def test_empty_file_raises_decode_error(self):
+        path = os.path.join(self.tmp_dir.name, "empty.json")
+        open(path, 'w').close()
+
+        with self.assertRaises(json.JSONDecodeError):
+            processor._load_json(path)
+
+
+class AnalyzeManyFromJsonTest(unittest.TestCase):
+
+    DOCUMENTS = [
+        DOCUMENT,
+        {
+            "contractName": "Minter",
+            "sourceCode": "contract Minter {\n"
+                          "    function reward(address to, uint256 amount) internal {\n"
+                          "        totalSupply += amount;\n"
+                          "    }\n"
+                          "}\n",
+            "bytecode": "0x6080604052348015600f57600080fd5b50"
+        },
+        {"contractName": "SourceOnly", "sourceCode": "contract SourceOnly {}\n"},
+    ]
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.paths = []
+        for index, document in enumerate(self.DOCUMENTS):
+            path = os.path.join(self.tmp_dir.name, "input%d.json" % index)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(document, f, ensure_ascii=False)
+            self.paths.append(path)
+
+    @staticmethod
+    def _comparable(report):
+        """Report fields that do not depend on timing"""
+        source_report = report["source_code_analysis"]
+        bytecode_report = report["bytecode_analysis"]
+        return {
+            "contract_name": report["metadata"]["contract_name"],
+            "overall_assessment": report["overall_assessment"],
+            "ste_results": source_report and source_report["ste_results"],
+            "bytecode_metadata": bytecode_report and bytecode_report.metadata,
+            "bytecode_results": bytecode_report and bytecode_report.results,
+        }
+
+    def test_process_pool_matches_serial_analysis_in_order(self):
+        token_processor = processor.TokenAnalysisProcessor()
+        with contextlib.redirect_stdout(io.StringIO()):
+            reports = token_processor.analyze_many_from_json(self.paths, max_workers=2)
+            expected = [token_processor.analyze_from_json(path) for path in self.paths]
+
+        self.assertEqual([self._comparable(report) for report in reports],
+                         [self._comparable(report) for report in expected])
+
+
+@unittest.skipIf(processor.orjson is None, "needs orjson")
+class SaveReportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def _save(self, token_processor, report, name):
+        path = os.path.join(self.tmp_dir.name, name)
+        with contextlib.redirect_stdout(io.StringIO()):
+            token_processor.save_report(report, path)
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_orjson_and_json_write_the_same_values(self):
+        input_path = os.path.join(self.tmp_dir.name, "input.json")
+        with open(input_path, 'w', encoding='utf-8') as f:
+            json.dump(DOCUMENT, f, ensure_ascii=False)
+
+        token_processor = processor.TokenAnalysisProcessor()
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = token_processor.analyze_from_json(input_path)
+        # The bytecode report is an AnalysisReport dataclass, serialized by
+        # orjson natively and by json through _json_default
+        self.assertIsInstance(report["bytecode_analysis"], processor.AnalysisReport)
+
+        with_orjson = self._save(token_processor, report, "orjson.json")
+        with mock.patch.object(processor, "orjson", None):
+            with_json = self._save(token_processor, report, "json.json")
+
+        # Float formatting may differ (1e-05 vs 0.00001); the values may not
+        self.assertEqual(json.loads(with_orjson), json.loads(with_json))
+        # Non-ASCII text (the Korean STE descriptions) is written as UTF-8
+        self.assertNotIn(b"\\u", with_json)
+
+
+if __name__ == "__main__":
+    unittest.main()